@@ -0,0 +1,100 @@
+"""
+Measure how long manage.py takes to start, and which imports it spends it on.
+
+    python bench_startup.py [--runs N] [--profile] [COMMAND ARGS...]
+
+Defaults to ``start -- -h``, which loads the command and builds its parser
+without touching the cloud.
+
+"""
+import __builtin__
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MANAGE = os.path.join(HERE, 'manage.py')
+
+
+def time_runs(argv, runs):
+    cmd = [sys.executable, MANAGE] + argv
+    timings = []
+    with open(os.devnull, 'w') as devnull:
+        for _ in range(runs):
+            start_t = time.time()
+            subprocess.call(cmd, stdout=devnull, stderr=devnull, cwd=HERE)
+            timings.append(time.time() - start_t)
+    return timings
+
+
+def profile_imports(command):
+    """
+    Import a command the way manage.py does, timing each new module.
+
+    Only meaningful in a fresh interpreter, see ``profile_in_child``.
+
+    """
+    timings = {}
+    real_import = __builtin__.__import__
+
+    def timed_import(name, *args, **kw):
+        if name in sys.modules:
+            return real_import(name, *args, **kw)
+        start_t = time.time()
+        try:
+            return real_import(name, *args, **kw)
+        finally:
+            timings[name] = timings.get(name, 0) + time.time() - start_t
+
+    __builtin__.__import__ = timed_import
+    try:
+        import manage
+        manage.import_object(manage.commands[command])
+    finally:
+        __builtin__.__import__ = real_import
+    return timings
+
+
+def profile_in_child(command):
+    """Profile the imports of ``command`` in a new interpreter"""
+    out = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), '--profile-child',
+         command], cwd=HERE)
+    return json.loads(out)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark manage.py startup')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--profile', action='store_true',
+                        help='Show the slowest imports (cumulative)')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--profile-child', help=argparse.SUPPRESS)
+    options, argv = parser.parse_known_args()
+    argv = argv or ['start', '--', '-h']
+
+    if options.profile_child:
+        timings = profile_imports(options.profile_child)
+        json.dump({
+            'timings': timings,
+            'loaded': [m for m in ('boto', 'paramiko') if m in sys.modules],
+        }, sys.stdout)
+        sys.exit()
+
+    if options.profile:
+        profile = profile_in_child(argv[0])
+        print 'Import profile for {} (cumulative ms)'.format(argv[0])
+        for name, t in sorted(profile['timings'].items(),
+                              key=lambda i: -i[1])[:options.top]:
+            print '{:>9.1f}  {}'.format(t * 1000, name)
+        for heavy in ('boto', 'paramiko'):
+            print '{} loaded: {}'.format(heavy, heavy in profile['loaded'])
+        print
+
+    timings = time_runs(argv, options.runs)
+    print 'manage.py {}: min {:0.1f}ms, mean {:0.1f}ms over {} runs'.format(
+        ' '.join(argv), min(timings) * 1000,
+        sum(timings) / len(timings) * 1000, len(timings))
@@ -1,22 +1,20 @@
 import os
 import argparse
 
-from pynecroud.cmd import (
-    SaveCommand,
-    LoadCommand,
-    KillCommand,
-    StartCommand,
-    ChangeWorldCommand,
-    ChangeInstanceTypeCommand
-)
+from pynecroud.util import import_object
 
+# Command paths are only imported once chosen, keeping --help and the
+# command table free of their dependencies
 commands = {
-    'save': SaveCommand,
-    'kill': KillCommand,
-    'load': LoadCommand,
-    'start': StartCommand,
-    'change_world': ChangeWorldCommand,
-    'change_instance_type': ChangeInstanceTypeCommand
+    'save': 'pynecroud.cmd:SaveCommand',
+    'kill': 'pynecroud.cmd:KillCommand',
+    'load': 'pynecroud.cmd:LoadCommand',
+    'start': 'pynecroud.cmd:StartCommand',
+    'stop': 'pynecroud.cmd:StopCommand',
+    'change_world': 'pynecroud.cmd:ChangeWorldCommand',
+    'change_instance_type': 'pynecroud.cmd:ChangeInstanceTypeCommand',
+    'pregenerate': 'pynecroud.cmd:PregenerateCommand',
+    'pack': 'pynecroud.cmd:PackCommand'
 }
 
 HELP_TEXT = """
@@ -36,6 +34,6 @@ if __name__ == '__main__':
     parser.add_argument('command', choices=commands.keys())
 
     args, remainder = parser.parse_known_args()
-    cmd_kls = commands[args.command]
+    cmd_kls = import_object(commands[args.command])
     cmd = cmd_kls.from_args_list(remainder)
     cmd.full_run()
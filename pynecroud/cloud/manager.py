@@ -21,6 +21,12 @@ class ServerManager(object):
     def kill_instance(self, *args, **kwargs):
         raise NotImplementedError('kill_instance')
 
+    def stop_instance(self, *args, **kwargs):
+        raise NotImplementedError('stop_instance')
+
+    def resume_instance(self, *args, **kwargs):
+        raise NotImplementedError('resume_instance')
+
     def _wait(self, *args, **kw):
         raise NotImplementedError('wait')
 
@@ -70,6 +76,20 @@ class EC2Manager(ServerManager):
                 raise
         return group
 
+    def authorize_ports(self, group_name, from_port, to_port):
+        """Open a range of game ports, leaving already open ones alone"""
+        for protocol in ('tcp', 'udp'):
+            try:
+                self.ec2_connection.authorize_security_group(
+                    group_name,
+                    ip_protocol=protocol,
+                    from_port=from_port,
+                    to_port=to_port,
+                    cidr_ip='0.0.0.0/0')
+            except EC2ResponseError, err:
+                if err.code != 'InvalidPermission.Duplicate':
+                    raise
+
     def _get_or_create_keyname(self, key_name, key_dir='~/.ssh',
                                clear_knownhosts=False):
         key = self.ec2_connection.get_key_pair(key_name)
@@ -137,12 +157,32 @@ class EC2Manager(ServerManager):
             raise PynecroudError('Must launch instance first')
 
         log.info('Waiting for instance availability...')
-        while not self.instance.update() == 'running':
-            time.sleep(sleep_time)
+        self._wait_for_state('running', sleep_time)
 
         log.info('Waiting for ssh access...')
         sshclient_from_instance(self.instance, key_path, user_name=login_user)
 
+    def _get_instance(self, instance_id=None, dns_name=None):
+        if instance_id:
+            try:
+                resp = self.ec2_connection.get_all_instances(
+                    instance_ids=[instance_id])
+            except EC2ResponseError, err:
+                if err.code != 'InvalidInstanceID.NotFound':
+                    raise
+                resp = None
+        else:
+            resp = self.ec2_connection.get_all_instances(
+                filters={'dns-name': dns_name})
+        if not resp or not resp[0].instances:
+            raise PynecroudError('Instance {} not found'.format(
+                instance_id or dns_name))
+        return resp[0].instances[0]
+
+    def _wait_for_state(self, state, sleep_time=2):
+        while not self.instance.update() == state:
+            time.sleep(sleep_time)
+
     def kill_instance(self, instance_id=None, dns_name=None):
         if not instance_id and not dns_name:
             raise PynecroudError('Must specify instance_id or dns_name')
@@ -151,6 +191,38 @@ class EC2Manager(ServerManager):
             self.ec2_connection.terminate_instances(
                 instance_ids=[instance_id])
         else:
-            resp = self.ec2_connection.get_all_instances(
-                filters={'dns-name': dns_name})
-            resp[0].instances[0].terminate()
+            self._get_instance(dns_name=dns_name).terminate()
+
+    def stop_instance(self, instance_id=None, dns_name=None, block=True):
+        """Stop an instance, keeping its EBS volumes for a later resume"""
+        if not instance_id and not dns_name:
+            raise PynecroudError('Must specify instance_id or dns_name')
+        self.instance = self._get_instance(instance_id, dns_name)
+        log.info('Stopping instance {}'.format(self.instance.id))
+        self.instance.stop()
+        if block:
+            log.info('Waiting for instance to stop...')
+            self._wait_for_state('stopped')
+
+    def resume_instance(self, instance_id, key_dir='~/.ssh', key_name=None,
+                        key_ext='.pem', login_user='ubuntu', block=True):
+        """Start a stopped instance back up with its volumes intact"""
+        self.instance = self._get_instance(instance_id)
+        state = self.instance.state
+        if state not in ('stopped', 'stopping', 'running', 'pending'):
+            raise PynecroudError('Cannot resume instance {} in state {}'
+                                 .format(instance_id, state))
+        self.key_path = os.path.join(
+            os.path.expanduser(key_dir),
+            (key_name or self.instance.key_name) + key_ext)
+
+        if state == 'stopping':
+            log.info('Waiting for instance to finish stopping...')
+            self._wait_for_state('stopped')
+            state = 'stopped'
+        if state == 'stopped':
+            log.info('Resuming instance {}'.format(instance_id))
+            self.instance.start()
+
+        if block:
+            self._wait(self.key_path, login_user=login_user)
@@ -86,10 +86,12 @@ class ServerRunner(object):
             cmd = cmd.format(**sub_params)
         stdin, stdout, stderr = self.conn.exec_command(cmd, **kw)
         if not quiet:
-            log.info(stdout.read())
+            out = stdout.read()
+            log.info(out)
             err = stderr.read()
             if err:
                 log.warn(err)
+            return out
 
     def run_script(self, script_path, sub_params=None, shell='bash', **kw):
         log.info(
@@ -99,5 +101,6 @@ class ServerRunner(object):
 
         cmd = '{shell} {remote_file}'.format(
             shell=shell, remote_file=remote_file)
-        self.run_cmd(cmd, **kw)
+        out = self.run_cmd(cmd, **kw)
         self.run_cmd('rm ' + remote_file)
+        return out
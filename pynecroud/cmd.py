@@ -5,11 +5,11 @@ import os
 import time
 
 import pynecroud
-from pynecroud.cloud.manager import EC2Manager
-from pynecroud.cloud.runner import ServerRunner
 from pynecroud.craft import MineCraftServer
-from pynecroud.exceptions import InvalidConfig
-from pynecroud.util import parse_config, asbool
+from pynecroud.exceptions import InvalidConfig, PynecroudError
+from pynecroud.sizing import JVMSizing
+from pynecroud import placement, swap
+from pynecroud.util import parse_config, asbool, import_object
 
 log = logging.getLogger(__name__)
 
@@ -22,6 +22,11 @@ class BaseCommand(object):
     parser.add_argument('--log_level', default='INFO')
     needs_config = True
 
+    # boto and paramiko are slow to import, so only load them once a
+    # command actually talks to the cloud or a server
+    manager_path = 'pynecroud.cloud.manager:EC2Manager'
+    runner_path = 'pynecroud.cloud.runner:ServerRunner'
+
     def __init__(self, options, config):
         self.options = options
         self.config = config
@@ -49,6 +54,14 @@ class BaseCommand(object):
             value = self.local_cache.get(key, default)
         return value
 
+    @property
+    def manager_cls(self):
+        return import_object(self.manager_path)
+
+    @property
+    def runner_cls(self):
+        return import_object(self.runner_path)
+
     def help_text(self):
         return self.parser.description
 
@@ -79,8 +92,6 @@ class KillCommand(BaseCommand):
         description='Kill a server',
         parents=[BaseCommand.parser])
 
-    manager_cls = EC2Manager
-
     parser.add_argument('--instance_id', help="ID of the instance to kill")
     parser.add_argument('--host', help="DNS Name of the instance to kill")
     parser.add_argument('--aws_region', help="AWS region of the instance")
@@ -97,6 +108,8 @@ class KillCommand(BaseCommand):
         manager.kill_instance(instance_id, host)
         self.local_cache.pop('instance_id', None)
         self.local_cache.pop('host', None)
+        self.local_cache.pop('stopped', None)
+        self.local_cache.pop('swap_setup', None)
 
 
 class StartCommand(BaseCommand):
@@ -113,41 +126,78 @@ class StartCommand(BaseCommand):
     parser.add_argument('--instance_type', help="Instance type")
     parser.add_argument(
         '--allocate_swap', action="store_true",
-        help="Allocate Swap Space for increased memory. This will cost money "
-             "due to EBS IO requests, but not very much. Could be a good "
-             "middle ground before upgrading an instance")
+        help="Allocate a swap file on the root volume, same as --swap file. "
+             "This will cost money due to EBS IO requests, but not very much")
+    parser.add_argument(
+        '--swap', choices=['auto', 'none', 'file', 'ephemeral', 'zram'],
+        help="Swap strategy for increased memory: compressed in-RAM swap "
+             "(zram), a swap file on the instance store (ephemeral) or on "
+             "the root volume (file). auto picks ephemeral when the instance "
+             "has an instance store, zram otherwise. Could be a good middle "
+             "ground before upgrading an instance")
+    parser.add_argument('--swap_size', type=int, help="Swap size in MB")
+    parser.add_argument('--swappiness', type=int, help="vm.swappiness")
+    parser.add_argument(
+        '--heap_size', help="JVM heap size, e.g. 1536M (default: sized to "
+                            "the instance type)")
+    parser.add_argument(
+        '--gc', help="Garbage collector: g1, cms, parallel or serial "
+                     "(default: picked for the instance type)")
+    parser.add_argument(
+        '--gc_flags', help="JVM GC flags, replacing the tuned defaults")
+    parser.add_argument(
+        '--pretouch', help="Pre-touch the heap at startup (true/false)")
     parser.add_argument('--key_name', help="Key name of the instance")
     parser.add_argument('--instance_name', help="Name of the instance")
     parser.add_argument('--login_user', help='OS user on remote server')
+    parser.add_argument(
+        '--lifecycle', choices=['cold', 'warm'],
+        help="cold (default) always launches and installs a new instance. "
+             "warm resumes the instance left by the stop command, skipping "
+             "install and load")
 
-    manager_cls = EC2Manager
-
-    def _get_launcher_args(self):
+    def _get_launcher_args(self, instance_type=None, update_cache=True):
         """This is EC2 specific"""
         # defaults to ubuntu 12.04 us-west-1
         ami = self._get_option('ami', 'ami-11e6c854')
         args = (ami,)
         kwargs = {
             "group_name": self._get_option('security_group', 'minecraft'),
-            "instance_type": self._get_option('instance_type', 't1.micro'),
+            "instance_type": instance_type or self._get_option(
+                'instance_type', 't1.micro'),
             "instance_name": self._get_option('instance_name', 'minecraft'),
             "key_name": self._get_option('key_name', 'minecraft'),
             "login_user": self._get_option('login_user', 'ubuntu')
         }
 
         # update cache
-        self.local_cache.update(kwargs)
-        self.local_cache['ami'] = ami
+        if update_cache:
+            self.local_cache.update(kwargs)
+            self.local_cache['ami'] = ami
 
         return args, kwargs
 
-    def _get_memory(self, allocate_swap):
-        instance_type = self.local_cache['instance_type']
-        if not allocate_swap and instance_type == 't1.micro':
-            memory = '512M'
+    def _get_swap(self, instance_type):
+        """Return the swap strategy (or None) and its size in MB"""
+        name = self._get_option('swap')
+        if name is None and asbool(self._get_option('allocate_swap', False)):
+            name = 'file'
+        strategy = swap.get_strategy(name, instance_type)
+        if strategy is None:
+            return None, 0
+        swap_mb = int(self._get_option(
+            'swap_size', strategy.default_size(instance_type)))
+        return strategy, swap_mb
+
+    def _get_sizing(self, instance_type, strategy, swap_mb):
+        if strategy is None:
+            sizing = JVMSizing.from_options(instance_type, self._get_option)
         else:
-            memory = '1024M'
-        return memory
+            sizing = JVMSizing.from_options(
+                instance_type, self._get_option, swap_mb=swap_mb,
+                swap_ratio=strategy.heap_ratio)
+        log.info('JVM sizing {}'.format(sizing))
+        return sizing
 
     def launch_instance(self, block=True):
         self.config['aws_region'] = self._get_option('aws_region', 'us-west-1')
@@ -160,17 +210,80 @@ class StartCommand(BaseCommand):
         return launcher
 
     def run(self):
+        stopped = self.local_cache.get('stopped')
+        if stopped and self._get_option('lifecycle', 'cold') != 'warm':
+            # launching now would lose track of the stopped instance
+            raise InvalidConfig(
+                'Instance {} is stopped, resume it with start -- --lifecycle '
+                'warm or terminate it with kill'.format(
+                    self.local_cache.get('instance_id')))
+        if stopped:
+            try:
+                self.resume()
+                return
+            except PynecroudError, err:
+                log.warn('Could not resume instance ({}), launching a new '
+                         'one'.format(err))
+        self.start_new()
+
+    def resume(self):
+        """Resume the stopped instance, its install and world intact"""
+        self.config['aws_region'] = self._get_option('aws_region', 'us-west-1')
+        manager = self.manager_cls(self.config)
+        user = self._get_option('login_user', 'ubuntu')
+        manager.resume_instance(
+            self.local_cache['instance_id'],
+            key_name=self._get_option('key_name'),
+            login_user=user)
+        runner = self.runner_cls(
+            manager.instance.dns_name,
+            user,
+            key_path=manager.key_path)
+        self.mcs = MineCraftServer(runner)
+
+        # swap does not survive a stop
+        swap_setup = self.local_cache.get('swap_setup')
+        if swap_setup:
+            self.mcs.allocate_swap(
+                swap.STRATEGIES[swap_setup['swap']],
+                swap_setup['swap_mb'],
+                swap_setup.get('swappiness'))
+
+        self.local_cache.pop('stopped')
+        self.local_cache.update({
+            "host": runner.host,
+            "key": manager.key_path,
+        })
+        log.critical('Instance is at {}'.format(runner.host))
+
+    def start_new(self):
+        # resolve the instance type and check the sizing config before
+        # launching, so a bad value cannot leave an untracked instance
+        instance_type = self._get_launcher_args()[1]['instance_type']
+        strategy, swap_mb = self._get_swap(instance_type)
+        swappiness = self._get_option('swappiness')
+        jvm_opts = self._get_sizing(
+            instance_type, strategy, swap_mb).jvm_opts()
+
         launcher = self.launch_instance()
         user = self._get_option('login_user', 'ubuntu')
-        allocate_swap = asbool(self._get_option('allocate_swap', False))
-        runner = ServerRunner(
+        runner = self.runner_cls(
             launcher.instance.dns_name,
             user,
             key_path=launcher.key_path)
         self.mcs = MineCraftServer(runner)
+        if (strategy is swap.STRATEGIES['ephemeral'] and
+                not self.mcs.has_instance_store()):
+            log.warn('No instance store mounted on {}, using file swap'
+                     .format(runner.host))
+            strategy = swap.STRATEGIES['file']
+            jvm_opts = self._get_sizing(
+                instance_type, strategy, swap_mb).jvm_opts()
         self.mcs.install(
-            allocate_swap=allocate_swap,
-            memory=self._get_memory(allocate_swap))
+            jvm_opts=jvm_opts,
+            swap=strategy,
+            swap_mb=swap_mb,
+            swappiness=swappiness)
 
         # writing is ec2 specific
         self.local_cache.update({
@@ -178,6 +291,15 @@ class StartCommand(BaseCommand):
             "host": runner.host,
             "key": launcher.key_path,
         })
+        self.local_cache.pop('stopped', None)
+        if strategy is None:
+            self.local_cache.pop('swap_setup', None)
+        else:
+            self.local_cache['swap_setup'] = {
+                "swap": strategy.name,
+                "swap_mb": swap_mb,
+                "swappiness": swappiness,
+            }
         log.critical('Instance is at {}'.format(runner.host))
 
 
@@ -197,7 +319,7 @@ class _BaseRunning(BaseCommand):
             'key', os.path.expanduser('~/.ssh/minecraft.pem'))
         if not host or not user:
             raise InvalidConfig('Host and user required')
-        runner = ServerRunner(host, user, key_path)
+        runner = self.runner_cls(host, user, key_path)
         mcs = MineCraftServer(runner)
         return mcs
 
@@ -250,6 +372,50 @@ class LoadCommand(_BaseRunning):
         })
 
 
+class StopCommand(_BaseRunning):
+    """Stop an instance, keeping it around for a warm start"""
+    parser = argparse.ArgumentParser(
+        prog='python manage.py stop --',
+        description='Stop a server, keeping its volume so that '
+                    'start --lifecycle warm can resume it',
+        parents=[_BaseRunning.parser])
+
+    parser.add_argument('--instance_id', help="ID of the instance to stop")
+    parser.add_argument('--aws_region', help="AWS region of the instance")
+    parser.add_argument(
+        '--backup', action='store_true',
+        help="Save the world to the local filesystem before stopping")
+    parser.add_argument('--data_folder', help='Folder to save world data')
+
+    def run(self):
+        instance_id = self._get_option('instance_id')
+        host = self._get_option('host')
+        if instance_id is None and host is None:
+            raise InvalidConfig(
+                'Must supply either the instance_id or the host')
+
+        if self.options.backup:
+            mcs = self.get_server()
+            world = self._get_option('world', 'world')
+            default_data_dir = os.path.join(
+                pynecroud.__path__[0], os.pardir, 'data')
+            local_folder = self._get_option('data_folder', default_data_dir)
+            mcs.save_world_to_local(world, local_folder)
+            self.local_cache.update({
+                "data_folder": local_folder,
+                "world": world
+            })
+
+        self.config['aws_region'] = self._get_option('aws_region', 'us-west-1')
+        manager = self.manager_cls(self.config)
+        manager.stop_instance(instance_id, host)
+
+        # the public DNS name changes when the instance comes back
+        self.local_cache['instance_id'] = manager.instance.id
+        self.local_cache['stopped'] = True
+        self.local_cache.pop('host', None)
+
+
 class ChangeWorldCommand(_BaseRunning):
     """Change world for a given server"""
     def run(self):
@@ -274,8 +440,6 @@ class ChangeInstanceTypeCommand(StartCommand):
                     'start load [kill]',
         parents=[BaseCommand.parser])
 
-    manager_cls = EC2Manager
-
     # cmd params
     parser.add_argument(
         '--no_kill', action='store_false', dest='kill', default=True,
@@ -290,9 +454,27 @@ class ChangeInstanceTypeCommand(StartCommand):
         '--instance_type', help="Instance type of the new instance")
     parser.add_argument(
         '--allocate_swap', action="store_true",
-        help="Allocate Swap Space for increased memory. This will cost money "
-             "due to EBS IO requests, but not very much. Could be a good "
-             "middle ground before upgrading an instance")
+        help="Allocate a swap file on the root volume, same as --swap file. "
+             "This will cost money due to EBS IO requests, but not very much")
+    parser.add_argument(
+        '--swap', choices=['auto', 'none', 'file', 'ephemeral', 'zram'],
+        help="Swap strategy for increased memory: compressed in-RAM swap "
+             "(zram), a swap file on the instance store (ephemeral) or on "
+             "the root volume (file). auto picks ephemeral when the instance "
+             "has an instance store, zram otherwise. Could be a good middle "
+             "ground before upgrading an instance")
+    parser.add_argument('--swap_size', type=int, help="Swap size in MB")
+    parser.add_argument('--swappiness', type=int, help="vm.swappiness")
+    parser.add_argument(
+        '--heap_size', help="JVM heap size, e.g. 1536M (default: sized to "
+                            "the instance type)")
+    parser.add_argument(
+        '--gc', help="Garbage collector: g1, cms, parallel or serial "
+                     "(default: picked for the instance type)")
+    parser.add_argument(
+        '--gc_flags', help="JVM GC flags, replacing the tuned defaults")
+    parser.add_argument(
+        '--pretouch', help="Pre-touch the heap at startup (true/false)")
     parser.add_argument('--key_name', help="Key name of the new instance")
     parser.add_argument('--instance_name', help="Name of the new instance")
     parser.add_argument('--login_user', help='OS user on new server')
@@ -318,11 +500,11 @@ class ChangeInstanceTypeCommand(StartCommand):
             'aws_region', 'us-west-1')
 
         # start new instance
-        StartCommand.run(self)
+        self.start_new()
 
         # save current state
         log.info('Saving current world...')
-        runner0 = ServerRunner(cur_host, cur_user, key_path)
+        runner0 = self.runner_cls(cur_host, cur_user, key_path)
         mcs0 = MineCraftServer(runner0)
         world = self._get_option('world', 'world')
         default_data_dir = os.path.join(
@@ -346,3 +528,266 @@ class ChangeInstanceTypeCommand(StartCommand):
             self.config['aws_region'] = cur_region
             manager = self.manager_cls(self.config)
             manager.kill_instance(dns_name=cur_host)
+
+
+class PregenerateCommand(StartCommand):
+    """
+    Generate terrain around spawn before players join.
+
+    Optionally runs on a temporary larger instance, handing the world to the
+    serving instance through save and load.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python manage.py pregenerate --',
+        description='Generate the terrain within a radius of spawn while the '
+                    'server is closed, so play runs on existing terrain',
+        parents=[BaseCommand.parser])
+
+    parser.add_argument(
+        '--radius', type=int,
+        help="Radius around spawn to generate, in blocks (default 1000)")
+    parser.add_argument(
+        '--pregen_instance_type',
+        help="Generate on a temporary instance of this type, then load the "
+             "world onto the serving instance. Default is to generate on the "
+             "serving instance")
+    parser.add_argument('--data_folder', help='Folder to save world data')
+
+    # serving instance
+    parser.add_argument('--host', help='IP of the serving instance')
+    parser.add_argument('--login_user', help='OS user on remote server')
+    parser.add_argument('--key', help='Path to private key')
+
+    # params for the temporary instance
+    parser.add_argument('--ami', help="Amazon Machine Image ID")
+    parser.add_argument('--aws_region', help="AWS Region (default us-west-1)")
+    parser.add_argument(
+        '--security_group', help="Security group, if missing will create")
+    parser.add_argument('--key_name', help="Key name of the instance")
+    parser.add_argument('--instance_name', help="Name of the instance")
+
+    def _get_serving_server(self):
+        host = self._get_option('host')
+        user = self._get_option('login_user')
+        key_path = self._get_option(
+            'key', os.path.expanduser('~/.ssh/minecraft.pem'))
+        if not host or not user:
+            return None
+        return MineCraftServer(self.runner_cls(host, user, key_path))
+
+    def _get_serving_sizing(self):
+        instance_type = self._get_option('instance_type', 't1.micro')
+        swap_setup = self.local_cache.get('swap_setup')
+        if not swap_setup:
+            return JVMSizing.from_options(instance_type, self._get_option)
+        return JVMSizing.from_options(
+            instance_type, self._get_option,
+            swap_mb=swap_setup['swap_mb'],
+            swap_ratio=swap.STRATEGIES[swap_setup['swap']].heap_ratio)
+
+    def run(self):
+        radius = int(self._get_option('radius', 1000))
+        world = self._get_option('world', 'world')
+        default_data_dir = os.path.join(
+            pynecroud.__path__[0], os.pardir, 'data')
+        local_folder = self._get_option('data_folder', default_data_dir)
+        pregen_type = self._get_option('pregen_instance_type')
+        serving = self._get_serving_server()
+
+        if not pregen_type:
+            if serving is None:
+                raise InvalidConfig('Host and user required')
+            serving.pregenerate(
+                world, radius, self._get_serving_sizing().jvm_opts())
+            return
+
+        # generate on a temporary instance, which never touches the cache
+        self.config['aws_region'] = self._get_option('aws_region', 'us-west-1')
+        launcher = self.manager_cls(self.config)
+        args, kwargs = self._get_launcher_args(
+            instance_type=pregen_type, update_cache=False)
+        kwargs['instance_name'] += '-pregen'
+        try:
+            launcher.launch_instance(*args, **kwargs)
+            runner = self.runner_cls(
+                launcher.instance.dns_name,
+                kwargs['login_user'],
+                key_path=launcher.key_path)
+            mcs = MineCraftServer(runner)
+            jvm_opts = JVMSizing(pregen_type).jvm_opts()
+            mcs.install(world=world, jvm_opts=jvm_opts)
+            if os.path.exists(os.path.join(local_folder, world + '.tar.gz')):
+                mcs.load_world_on_server(world, local_folder)
+            mcs.pregenerate(world, radius, jvm_opts)
+            mcs.save_world_to_local(world, local_folder)
+        finally:
+            # the launch itself may fail while waiting for the instance
+            if launcher.instance is not None:
+                launcher.kill_instance(launcher.instance.id)
+        self.local_cache.update({
+            "data_folder": local_folder,
+            "world": world
+        })
+
+        if serving is None:
+            log.critical('No serving instance, use load to upload the world')
+        else:
+            log.info('Loading data onto serving instance...')
+            serving.load_world_on_server(world, local_folder)
+
+
+class PackCommand(StartCommand):
+    """
+    Host several worlds per instance, each with its own upstart job, JVM,
+    heap and port.
+
+    Hosts are tracked in the local cache under ``hosting``.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python manage.py pack --',
+        description='Pack worlds onto shared instances by memory and '
+                    'expected players, each world with its own server '
+                    'process and port',
+        parents=[BaseCommand.parser])
+
+    parser.add_argument(
+        '--worlds',
+        help="Comma separated worlds to host, on top of the ones already "
+             "hosted. Each world's config section can set heap_size and "
+             "expected_players")
+    parser.add_argument(
+        '--instance_types',
+        help="Comma separated instance types new hosts may use "
+             "(default m1.small,m1.medium,m3.medium,m3.large). The default "
+             "AMI is paravirtual, so t2 types need an HVM --ami")
+    parser.add_argument(
+        '--rebalance', action='store_true',
+        help="Repack every world, migrating worlds off lightly used hosts "
+             "and retiring emptied ones")
+    parser.add_argument(
+        '--dry_run', action='store_true', help="Only show the plan")
+    parser.add_argument('--data_folder', help='Folder to save world data')
+
+    # params for new hosts
+    parser.add_argument('--ami', help="Amazon Machine Image ID")
+    parser.add_argument('--aws_region', help="AWS Region (default us-west-1)")
+    parser.add_argument(
+        '--security_group', help="Security group, if missing will create")
+    parser.add_argument('--key_name', help="Key name of new hosts")
+    parser.add_argument('--instance_name', help="Name of new hosts")
+    parser.add_argument('--login_user', help='OS user on remote server')
+
+    def _hosted_server(self, info, world):
+        runner = self.runner_cls(info['host'], info['login_user'], info['key'])
+        return MineCraftServer.hosted(runner, world)
+
+    def _launch_host(self, hosting, instance_type):
+        args, kwargs = self._get_launcher_args(
+            instance_type=instance_type, update_cache=False)
+        kwargs['instance_name'] += '-host'
+        launcher = self.manager_cls(self.config)
+        launcher.launch_instance(*args, **kwargs)
+        runner = self.runner_cls(
+            launcher.instance.dns_name,
+            kwargs['login_user'],
+            key_path=launcher.key_path)
+
+        # track the host before installing, so a failure cannot leave it
+        # running unnoticed
+        hosting[launcher.instance.id] = {
+            "host": runner.host,
+            "instance_type": instance_type,
+            "login_user": runner.user,
+            "key": launcher.key_path,
+            "worlds": {},
+        }
+        self.write_local_cache()
+        MineCraftServer(runner).install_base()
+        return launcher.instance.id
+
+    def run(self):
+        hosting = self.local_cache.setdefault('hosting', {})
+        names = set(w for info in hosting.values() for w in info['worlds'])
+        names.update(w.strip() for w in (
+            self._get_option('worlds') or '').split(',') if w.strip())
+        if not names:
+            raise InvalidConfig('Must specify the worlds to host')
+        configs = dict(
+            (name, parse_config(self.options.config, name))
+            for name in names)
+        demands = dict(
+            (name, placement.WorldDemand.from_config(name, configs[name]))
+            for name in names)
+        instance_types = self._get_option(
+            'instance_types',
+            'm1.small,m1.medium,m3.medium,m3.large').split(',')
+        hosts = [
+            placement.Host(instance_id, info['instance_type'], info['worlds'])
+            for instance_id, info in hosting.items()]
+
+        plan = placement.plan_placement(
+            demands.values(), hosts, [t.strip() for t in instance_types],
+            rebalance=asbool(self._get_option('rebalance', False)))
+        log.critical('Placement plan:\n' + plan.describe())
+        if self.options.dry_run:
+            return
+
+        default_data_dir = os.path.join(
+            pynecroud.__path__[0], os.pardir, 'data')
+        local_folder = self._get_option('data_folder', default_data_dir)
+        self.config['aws_region'] = self._get_option('aws_region', 'us-west-1')
+        manager = self.manager_cls(self.config)
+
+        # plan names for new hosts -> instance ids
+        instance_ids = dict((h.name, h.name) for h in hosts)
+        for host in plan.launches:
+            instance_ids[host.name] = self._launch_host(
+                hosting, host.instance_type)
+
+        ports = [p for host in plan.hosts for p in host.ports.values()]
+        manager.authorize_ports(
+            self._get_option('security_group', 'minecraft'),
+            placement.BASE_PORT, max(ports))
+
+        # take migrating worlds down first to free up room on their hosts
+        for world, src, dst in plan.moves:
+            if src is None:
+                continue
+            log.info('Saving {} from {}...'.format(world, src))
+            mcs = self._hosted_server(hosting[src], world)
+            mcs.save_world_to_local(world, local_folder)
+            mcs.remove_world()
+            del hosting[src]['worlds'][world]
+            self.write_local_cache()
+
+        planned = dict((h.name, h) for h in plan.hosts)
+        for world, src, dst in plan.moves:
+            host = planned[dst]
+            info = hosting[instance_ids[dst]]
+            config = configs[world]
+            sizing = JVMSizing(
+                host.instance_type,
+                heap_size='{}M'.format(demands[world].heap_mb),
+                gc=config.get('gc'),
+                gc_flags=config.get('gc_flags'),
+                pretouch=config.get('pretouch'))
+            log.info('Adding {} to {}...'.format(world, instance_ids[dst]))
+            mcs = self._hosted_server(info, world)
+            mcs.add_world(world, host.ports[world], sizing.jvm_opts())
+            info['worlds'][world] = host.ports[world]
+            self.write_local_cache()
+            if os.path.exists(os.path.join(local_folder, world + '.tar.gz')):
+                mcs.load_world_on_server(world, local_folder)
+
+        for host in plan.retires:
+            manager.kill_instance(host.name)
+            del hosting[host.name]
+            self.write_local_cache()
+
+        self.local_cache['data_folder'] = local_folder
+        for info in hosting.values():
+            for world, port in sorted(info['worlds'].items()):
+                log.critical(
+                    '{} is at {}:{}'.format(world, info['host'], port))
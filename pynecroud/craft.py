@@ -1,48 +1,171 @@
 from contextlib import contextmanager
+import logging
 import os
+import time
 
 import pynecroud
+from pynecroud import pregen
 from pynecroud.exceptions import PynecroudError
 from pynecroud.util import temporary_file
 
+log = logging.getLogger(__name__)
+
 
 class MineCraftServer(object):
 
     SCRIPT_DIR = os.path.join(pynecroud.__path__[0], 'scripts')
 
-    def __init__(self, runner):
+    def __init__(self, runner, job='minecraft-server',
+                 server_dir='/srv/minecraft-server'):
         self.runner = runner
+        self.job = job
+        self.server_dir = server_dir
+
+    @classmethod
+    def hosted(cls, runner, world):
+        """A world with its own upstart job and JVM on a shared instance"""
+        # kept apart from the default server's job and directory, so even a
+        # world named server cannot clash with them
+        return cls(runner, job='minecraft-world-' + world,
+                   server_dir='/srv/worlds/' + world)
 
     def _script_path(self, script_name):
         return os.path.join(self.SCRIPT_DIR, script_name)
 
-    def install(self, world='world', memory='1024M', allocate_swap=False):
-        self.runner.run_script(self._script_path('init.sh'))
-        self.runner.run_script(
-            self._script_path('new.sh'),
-            sub_params={'world_name': world})
-        if allocate_swap:
-            self.runner.run_script(self._script_path('allocate_swap.sh'))
-        script_path = self._script_path('conf/minecraft-server.conf')
+    def _run_script(self, script_name, sub_params=None, **kw):
+        params = {'job': self.job, 'server_dir': self.server_dir}
+        params.update(sub_params or {})
+        return self.runner.run_script(
+            self._script_path(script_name), sub_params=params, **kw)
+
+    def _upload_job(self, jvm_opts):
         self.runner.upload(
-            script_path, '/etc/init/minecraft-server.conf', as_root=True,
-            subparams={'memory': 'memory'})
+            self._script_path('conf/minecraft-server.conf'),
+            '/etc/init/{}.conf'.format(self.job), as_root=True,
+            subparams={
+                'job': self.job,
+                'server_dir': self.server_dir,
+                'jvm_opts': jvm_opts,
+            })
+
+    def install_base(self, swap=None, swap_mb=0, swappiness=None):
+        """Install java and the server jar, without starting a server"""
+        self.runner.run_script(self._script_path('init.sh'))
+        self.runner.run_script(self._script_path('new.sh'))
+        if swap is not None:
+            self.allocate_swap(swap, swap_mb, swappiness)
+
+    def install(self, world='world', jvm_opts='-Xms1024M -Xmx1024M',
+                swap=None, swap_mb=0, swappiness=None):
+        self.install_base(swap, swap_mb, swappiness)
+        self._upload_job(jvm_opts)
         self.start()
         if world != 'world':
             with self.lower_server():
                 self.change_world(world)
 
+    def add_world(self, world, port, jvm_opts):
+        """Set up a hosted world's server directory and job, and start it"""
+        self._run_script(
+            'add_world.sh', sub_params={'world_name': world, 'port': port})
+        self._upload_job(jvm_opts)
+        self.start()
+
+    def remove_world(self):
+        """Stop a hosted world and remove its job and server directory"""
+        self._run_script('remove_world.sh')
+
+    def has_instance_store(self):
+        """Whether an instance-store disk is mounted on /mnt"""
+        out = self.runner.run_cmd('mountpoint -q /mnt && echo mounted')
+        return bool(out) and out.strip() == 'mounted'
+
+    def allocate_swap(self, strategy, size_mb, swappiness=None):
+        self.runner.run_script(
+            self._script_path(strategy.script),
+            sub_params=strategy.sub_params(size_mb, swappiness))
+
     def stop(self):
-        self.runner.run_script(self._script_path('stop.sh'))
+        self._run_script('stop.sh')
 
     def start(self):
-        self.runner.run_script(self._script_path('start.sh'))
+        self._run_script('start.sh')
 
     def change_world(self, world):
         with self.lower_server():
-            self.runner.run_script(
-                self._script_path('change_world.sh'),
-                sub_params={"world_name": world})
+            self._run_script(
+                'change_world.sh', sub_params={"world_name": world})
+
+    def read_spawn(self, world):
+        """Return the world's spawn point as (x, y, z)"""
+        out = self._run_script(
+            'read_spawn.py', sub_params={'world_name': world}, shell='python')
+        try:
+            x, y, z = [int(v) for v in out.split()]
+        except (AttributeError, ValueError):
+            raise PynecroudError(
+                'Could not read spawn point of {}'.format(world))
+        return x, y, z
+
+    def pregenerate(self, world, radius, jvm_opts='-Xms1024M -Xmx1024M'):
+        """
+        Generate the terrain within ``radius`` blocks of spawn while the
+        server is closed to players.
+
+        Each run of the server generates the area around spawn, then moves
+        spawn on to the next area; the last run puts it back, as does a
+        failed run. Returns the number of chunks generated.
+
+        """
+        area_chunks = pregen.SPAWN_AREA_CHUNKS ** 2
+        chunks = 0
+        with self.lower_server():
+            # make sure the server runs ``world``, and that it exists on disk
+            # with its spawn point saved, before reading spawn
+            self._run_script(
+                'change_world.sh', sub_params={"world_name": world})
+            self._run_server('save-all', jvm_opts)
+            spawn_x, spawn_y, spawn_z = self.read_spawn(world)
+            centers = pregen.area_centers(spawn_x, spawn_z, radius)
+            log.info('Pre-generating {} areas within {} blocks of spawn'
+                     .format(len(centers), radius))
+            targets = centers + [(spawn_x, spawn_z)]
+
+            restored = False
+            try:
+                # the first run only loads the existing spawn area
+                self._pregen_area(targets[0], spawn_y, jvm_opts)
+                start_t = time.time()
+                for i, target in enumerate(targets[1:], 1):
+                    self._pregen_area(target, spawn_y, jvm_opts)
+                    chunks = i * area_chunks
+                    log.info('Pre-generated {}/{} areas, {} chunks, '
+                             '{:0.1f} chunks/s'.format(
+                                 i, len(centers), chunks,
+                                 chunks / (time.time() - start_t)))
+                restored = True
+            finally:
+                if not restored:
+                    # never leave spawn out in the pre-generated terrain
+                    self._run_server('setworldspawn {} {} {}'.format(
+                        spawn_x, spawn_y, spawn_z), jvm_opts)
+        return chunks
+
+    def _run_server(self, command, jvm_opts):
+        """Run the server outside its job until it is up, then ``command``"""
+        self._run_script(
+            'run_server.sh',
+            sub_params={
+                'command': command,
+                'jvm_opts': jvm_opts,
+                'timeout': pregen.AREA_TIMEOUT,
+            })
+
+    def _pregen_area(self, next_spawn, spawn_y, jvm_opts):
+        self._run_server(
+            'setworldspawn {} {} {}'.format(
+                next_spawn[0], spawn_y, next_spawn[1]),
+            jvm_opts)
 
     @contextmanager
     def lower_server(self):
@@ -54,8 +177,7 @@ class MineCraftServer(object):
 
     def save_world_to_local(self, world, local_folder):
         with self.lower_server():
-            self.runner.run_script(
-                self._script_path('save.sh'), sub_params={'world_name': world})
+            self._run_script('save.sh', sub_params={'world_name': world})
         saved = '~/{world}.tar.gz'.format(world=world)
         local_path = os.path.join(local_folder, os.path.basename(saved))
         if os.path.exists(local_path):
@@ -72,5 +194,4 @@ class MineCraftServer(object):
         self.runner.upload(local_path, fname)
 
         with self.lower_server():
-            self.runner.run_script(
-                self._script_path('load.sh'), sub_params={'world_name': world})
+            self._run_script('load.sh', sub_params={'world_name': world})
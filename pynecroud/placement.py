@@ -0,0 +1,250 @@
+import re
+
+from pynecroud.exceptions import InvalidConfig
+from pynecroud.sizing import (
+    INSTANCE_SPECS, MIN_RESERVE_MB, HEAP_STEP_MB, parse_memory)
+
+# hosted worlds listen on consecutive ports from the default one
+BASE_PORT = 25565
+
+# memory each JVM needs on top of its heap (permgen, code cache, stacks)
+JVM_OVERHEAD_MB = 128
+
+# heap for a world without a heap_size in its config
+BASE_HEAP_MB = 256
+HEAP_PER_PLAYER_MB = 128
+MIN_WORLD_HEAP_MB = 512
+
+# how many concurrent players a vCPU keeps up with
+PLAYERS_PER_VCPU = 6
+
+WORLD_NAME_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+class WorldDemand(object):
+    """What a world needs from its host"""
+
+    def __init__(self, name, players=2, heap_mb=None):
+        if not WORLD_NAME_RE.match(name):
+            raise InvalidConfig(
+                'World names for hosting may only contain letters, digits, '
+                '- and _, got {}'.format(name))
+        self.name = name
+        self.players = players
+        if heap_mb is None:
+            heap_mb = BASE_HEAP_MB + HEAP_PER_PLAYER_MB * players
+            heap_mb = -(-heap_mb // HEAP_STEP_MB) * HEAP_STEP_MB
+            heap_mb = max(heap_mb, MIN_WORLD_HEAP_MB)
+        self.heap_mb = heap_mb
+
+    @classmethod
+    def from_config(cls, name, config):
+        """Build from a world's config.ini section"""
+        heap_size = config.get('heap_size')
+        return cls(
+            name,
+            players=int(config.get('expected_players', 2)),
+            heap_mb=parse_memory(heap_size) if heap_size else None)
+
+    @property
+    def memory_mb(self):
+        return self.heap_mb + JVM_OVERHEAD_MB
+
+    @property
+    def load(self):
+        return max(self.players, 1)
+
+    def __repr__(self):
+        return '<WorldDemand {} heap={}M players={}>'.format(
+            self.name, self.heap_mb, self.players)
+
+
+class Host(object):
+    """An instance and the worlds placed on it, each with its own port"""
+
+    def __init__(self, name, instance_type, ports=None):
+        if instance_type not in INSTANCE_SPECS:
+            raise InvalidConfig(
+                'Unknown instance type {}'.format(instance_type))
+        self.name = name
+        self.instance_type = instance_type
+        memory_mb, vcpus = INSTANCE_SPECS[instance_type]
+        self.memory_budget = memory_mb - MIN_RESERVE_MB
+        self.load_budget = vcpus * PLAYERS_PER_VCPU
+        # world name -> port, for worlds currently on the host
+        self.ports = dict(ports or {})
+        self.worlds = {}
+
+    @property
+    def memory_used(self):
+        return sum(w.memory_mb for w in self.worlds.values())
+
+    @property
+    def load_used(self):
+        return sum(w.load for w in self.worlds.values())
+
+    def fits(self, world):
+        return (self.memory_used + world.memory_mb <= self.memory_budget and
+                self.load_used + world.load <= self.load_budget)
+
+    def slack(self, world):
+        """Memory left over if ``world`` were added"""
+        return self.memory_budget - self.memory_used - world.memory_mb
+
+    def add(self, world, port=None):
+        if port is None:
+            # ports of worlds already on the host stay theirs until they
+            # are known to have moved away
+            taken = set(self.ports.values())
+            port = BASE_PORT
+            while port in taken:
+                port += 1
+        self.worlds[world.name] = world
+        self.ports[world.name] = port
+        return port
+
+    def __repr__(self):
+        return '<Host {} {} worlds={}>'.format(
+            self.name, self.instance_type, sorted(self.worlds))
+
+
+class Plan(object):
+    """
+    Where every world should run, and the moves needed to get there.
+
+    ``moves`` is a list of (world, from host name or None, to host name)
+    where a from of None is a world that is not hosted yet.
+
+    """
+
+    def __init__(self, hosts, moves, launches, retires):
+        self.hosts = hosts
+        self.moves = moves
+        self.launches = launches
+        self.retires = retires
+
+    def describe(self):
+        lines = []
+        for host in self.hosts:
+            lines.append('{} ({}): {}M/{}M, {}/{} players'.format(
+                host.name, host.instance_type, host.memory_used,
+                host.memory_budget, host.load_used, host.load_budget))
+            for name in sorted(host.worlds):
+                world = host.worlds[name]
+                lines.append('    {} port {} heap {}M'.format(
+                    name, host.ports[name], world.heap_mb))
+        for world, src, dst in self.moves:
+            lines.append('{} {} -> {}'.format(
+                'Migrate' if src else 'Add', world, dst) +
+                (' (from {})'.format(src) if src else ''))
+        for host in self.retires:
+            lines.append('Retire {}'.format(host.name))
+        return '\n'.join(lines)
+
+
+def _fill_count(instance_type, worlds):
+    """How many of the leading ``worlds`` fit on a new host of a type"""
+    host = Host(None, instance_type)
+    for i, world in enumerate(worlds):
+        if not host.fits(world):
+            return i
+        host.add(world)
+    return len(worlds)
+
+
+def _new_host_type(worlds, instance_types):
+    """
+    Smallest allowed type that takes as many of the leading ``worlds`` as
+    the largest type would, so a host is never bigger than what it gets.
+
+    """
+    by_size = sorted(instance_types, key=lambda t: INSTANCE_SPECS[t])
+    most = _fill_count(by_size[-1], worlds)
+    for instance_type in by_size:
+        if _fill_count(instance_type, worlds) >= most:
+            return instance_type
+
+
+def plan_placement(worlds, hosts, instance_types, rebalance=False):
+    """
+    Bin-pack worlds onto hosts by memory and expected players.
+
+    Without ``rebalance`` worlds stay where they are as long as they still
+    fit, and only new or displaced worlds are placed. With it every world
+    is repacked best-fit decreasing, preferring its current host on ties, so
+    worlds migrate off lightly used hosts which are then retired. New hosts
+    use the smallest of ``instance_types`` that fits what they will take.
+
+    """
+    if not instance_types:
+        raise InvalidConfig('Must supply instance types for new hosts')
+    for instance_type in instance_types:
+        if instance_type not in INSTANCE_SPECS:
+            raise InvalidConfig(
+                'Unknown instance type {}'.format(instance_type))
+
+    existing = set(host.name for host in hosts)
+    current = {}
+    planned = []
+    for host in hosts:
+        for name in host.ports:
+            current[name] = host.name
+        planned.append(Host(host.name, host.instance_type, host.ports))
+    by_name = dict((h.name, h) for h in planned)
+
+    def place(world, host):
+        old = host.ports.get(world.name) if host.name == current.get(
+            world.name) else None
+        host.add(world, old)
+
+    # among equals, hosted worlds go first so they are not displaced
+    ordered = sorted(worlds, key=lambda w: (
+        -w.memory_mb, -w.load, w.name not in current, w.name))
+    unplaced = []
+    for world in ordered:
+        host = by_name.get(current.get(world.name))
+        if not rebalance and host is not None and host.fits(world):
+            place(world, host)
+        else:
+            unplaced.append(world)
+
+    new_count = 0
+    for i, world in enumerate(unplaced):
+        used = [h for h in planned if h.worlds and h.fits(world)]
+        if used:
+            # best fit, staying put on ties
+            host = min(used, key=lambda h: (
+                h.slack(world), h.name != current.get(world.name)))
+        else:
+            empty = [h for h in planned if not h.worlds and h.fits(world)]
+            if empty:
+                host = max(empty, key=lambda h: (
+                    h.name == current.get(world.name), h.memory_budget))
+            else:
+                new_count += 1
+                instance_type = _new_host_type(unplaced[i:], instance_types)
+                host = Host('new-{}'.format(new_count), instance_type)
+                if not host.fits(world):
+                    raise InvalidConfig(
+                        'No instance type in {} fits {}'.format(
+                            ', '.join(instance_types), world))
+                planned.append(host)
+                by_name[host.name] = host
+        place(world, host)
+
+    for host in planned:
+        # ports of worlds that moved away are free again
+        for name in list(host.ports):
+            if name not in host.worlds:
+                del host.ports[name]
+
+    moves = []
+    for world in ordered:
+        dst = [h for h in planned if world.name in h.worlds][0]
+        src = current.get(world.name)
+        if src != dst.name:
+            moves.append((world.name, src, dst.name))
+    launches = [h for h in planned if h.name not in existing]
+    retires = [h for h in planned if not h.worlds and h.name in existing]
+    kept = [h for h in planned if h.worlds]
+    return Plan(kept, moves, launches, retires)
@@ -0,0 +1,36 @@
+import math
+
+# the server generates this many chunks along each side of spawn on startup
+SPAWN_AREA_CHUNKS = 25
+SPAWN_AREA_BLOCKS = SPAWN_AREA_CHUNKS * 16
+
+# seconds to wait for the server to come up before moving on regardless
+AREA_TIMEOUT = 600
+
+
+def area_centers(spawn_x, spawn_z, radius):
+    """
+    Centers of the spawn-sized areas covering ``radius`` blocks around spawn.
+
+    The spawn area itself is left out as it already exists. Centers are
+    ordered nearest first, so an interrupted run still covers the terrain
+    players reach soonest.
+
+    """
+    half = SPAWN_AREA_BLOCKS // 2
+    steps = int(math.ceil(max(radius - half, 0) / float(SPAWN_AREA_BLOCKS)))
+    centers = []
+    for i in range(-steps, steps + 1):
+        for j in range(-steps, steps + 1):
+            if i == 0 and j == 0:
+                continue
+            # distance from spawn to the nearest edge of the area
+            dx = max(abs(i) * SPAWN_AREA_BLOCKS - half, 0)
+            dz = max(abs(j) * SPAWN_AREA_BLOCKS - half, 0)
+            if dx ** 2 + dz ** 2 > radius ** 2:
+                continue
+            centers.append(
+                (spawn_x + i * SPAWN_AREA_BLOCKS,
+                 spawn_z + j * SPAWN_AREA_BLOCKS))
+    centers.sort(key=lambda c: (c[0] - spawn_x) ** 2 + (c[1] - spawn_z) ** 2)
+    return centers
@@ -0,0 +1,10 @@
+WORLDNAME="{world_name}"
+DIR={server_dir}
+sudo mkdir -p $DIR
+sudo cp /srv/minecraft-server/minecraft_server.jar $DIR/
+if [ -e $DIR/server.properties ]; then
+    sudo sed --in-place=.bk "s/level-name=.*/level-name=$WORLDNAME/1; s/server-port=.*/server-port={port}/1" $DIR/server.properties
+else
+    printf "level-name=%s\nserver-port=%s\n" "$WORLDNAME" {port} | sudo tee $DIR/server.properties > /dev/null
+fi
+sudo chown -R minecraft $DIR
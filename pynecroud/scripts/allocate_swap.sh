@@ -1,3 +1,6 @@
-sudo /bin/dd if=/dev/zero of=/var/swap.1 bs=1M count=1024
-sudo /sbin/mkswap /var/swap.1
-sudo /sbin/swapon /var/swap.1
+SWAPFILE=/var/swap.1
+sudo fallocate -l {size_mb}M $SWAPFILE || sudo /bin/dd if=/dev/zero of=$SWAPFILE bs=1M count={size_mb}
+sudo chmod 600 $SWAPFILE
+sudo /sbin/mkswap $SWAPFILE
+sudo /sbin/swapon $SWAPFILE
+sudo sysctl -w vm.swappiness={swappiness}
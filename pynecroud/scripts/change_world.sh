@@ -1,3 +1,3 @@
 WORLDNAME="{world_name}"
-DEST=/srv/minecraft-server/server.properties
+DEST={server_dir}/server.properties
 sudo sed --in-place=.bk "s/level-name=.*/level-name=$WORLDNAME/1" "$DEST"
\ No newline at end of file
@@ -1,5 +1,5 @@
 WORLDNAME="{world_name}"
-DEST=/srv/minecraft-server/$WORLDNAME
+DEST={server_dir}/$WORLDNAME
 tar xvzf $WORLDNAME.tar.gz
 [ -e $DEST ] && rm -rf $DEST
 sudo mv $WORLDNAME $DEST
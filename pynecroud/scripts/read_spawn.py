@@ -0,0 +1,13 @@
+import gzip
+import struct
+
+LEVEL = '{server_dir}/{world_name}/level.dat'
+
+data = gzip.open(LEVEL).read()
+values = []
+for name in ('SpawnX', 'SpawnY', 'SpawnZ'):
+    # TAG_Int: type byte, name length, name, then a big-endian int
+    tag = struct.pack('>bh', 3, len(name)) + name
+    start = data.index(tag) + len(tag)
+    values.append(str(struct.unpack('>i', data[start:start + 4])[0]))
+print ' '.join(values)
@@ -0,0 +1,3 @@
+sudo stop {job}
+sudo rm -f /etc/init/{job}.conf
+sudo rm -rf {server_dir}
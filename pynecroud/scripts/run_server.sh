@@ -0,0 +1,8 @@
+LOG=/tmp/{job}-run.log
+cd {server_dir}
+rm -f $LOG
+# the server generates the area around spawn on startup. Once it is up,
+# run the command (e.g. move spawn on to the next area) and shut down
+(for i in $(seq {timeout}); do grep -q 'Done (' $LOG 2>/dev/null && break; sleep 1; done
+ echo "{command}"
+ echo "stop") | sudo -u minecraft /usr/bin/java {jvm_opts} -jar minecraft_server.jar nogui > $LOG 2>&1
@@ -1,3 +1,3 @@
 WORLDNAME="{world_name}"
-pushd /srv/minecraft-server
+pushd {server_dir}
 tar czf ~/$WORLDNAME.tar.gz $WORLDNAME
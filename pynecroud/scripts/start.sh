@@ -1 +1 @@
-sudo start minecraft-server
\ No newline at end of file
+sudo start {job}
\ No newline at end of file
@@ -1 +1 @@
-sudo stop minecraft-server
\ No newline at end of file
+sudo stop {job}
\ No newline at end of file
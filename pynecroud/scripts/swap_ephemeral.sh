@@ -0,0 +1,12 @@
+# cloud-init mounts the first instance-store disk on /mnt. The heap was
+# sized for instance-store swap, so never fall back to the root volume.
+if ! mountpoint -q /mnt; then
+    echo "No instance store mounted on /mnt, not allocating swap" >&2
+    exit 1
+fi
+SWAPFILE=/mnt/swap.1
+sudo fallocate -l {size_mb}M $SWAPFILE || sudo /bin/dd if=/dev/zero of=$SWAPFILE bs=1M count={size_mb}
+sudo chmod 600 $SWAPFILE
+sudo /sbin/mkswap $SWAPFILE
+sudo /sbin/swapon $SWAPFILE
+sudo sysctl -w vm.swappiness={swappiness}
@@ -0,0 +1,6 @@
+sudo modprobe zram num_devices=1 || (sudo apt-get -y install linux-image-extra-$(uname -r) && sudo modprobe zram num_devices=1)
+[ -e /sys/block/zram0/comp_algorithm ] && (echo lz4 | sudo tee /sys/block/zram0/comp_algorithm > /dev/null)
+echo $(({size_mb} * 1024 * 1024)) | sudo tee /sys/block/zram0/disksize > /dev/null
+sudo /sbin/mkswap /dev/zram0
+sudo /sbin/swapon -p 100 /dev/zram0
+sudo sysctl -w vm.swappiness={swappiness}
@@ -0,0 +1,186 @@
+import logging
+
+from pynecroud.exceptions import InvalidConfig
+from pynecroud.util import asbool
+
+log = logging.getLogger(__name__)
+
+# instance type -> (memory in MB, vCPUs)
+INSTANCE_SPECS = {
+    't1.micro': (613, 1),
+    't2.micro': (1024, 1),
+    't2.small': (2048, 1),
+    't2.medium': (4096, 2),
+    't2.large': (8192, 2),
+    'm1.small': (1740, 1),
+    'm1.medium': (3840, 1),
+    'm1.large': (7680, 2),
+    'm1.xlarge': (15360, 4),
+    'm3.medium': (3840, 1),
+    'm3.large': (7680, 2),
+    'm3.xlarge': (15360, 4),
+    'm3.2xlarge': (30720, 8),
+    'c1.medium': (1740, 2),
+    'c1.xlarge': (7168, 8),
+    'c3.large': (3840, 2),
+    'c3.xlarge': (7680, 4),
+    'c3.2xlarge': (15360, 8),
+    'm2.xlarge': (17510, 2),
+    'm2.2xlarge': (35020, 4),
+    'm2.4xlarge': (70041, 8),
+}
+DEFAULT_SPEC = (1024, 1)
+
+# GC name -> flags used when the config does not supply its own gc_flags
+GC_FLAGS = {
+    'g1': [
+        '-XX:+UseG1GC',
+        '-XX:MaxGCPauseMillis=50',
+        '-XX:+ParallelRefProcEnabled',
+        '-XX:InitiatingHeapOccupancyPercent=35',
+    ],
+    'cms': [
+        '-XX:+UseConcMarkSweepGC',
+        '-XX:+CMSIncrementalMode',
+        '-XX:+CMSIncrementalPacing',
+        '-XX:+UseParNewGC',
+    ],
+    'parallel': ['-XX:+UseParallelGC'],
+    'serial': ['-XX:+UseSerialGC'],
+}
+
+# Memory kept back for the OS and the JVM's non-heap areas
+MIN_RESERVE_MB = 192
+MAX_RESERVE_MB = 2048
+RESERVE_RATIO = 0.2
+
+# Instances below a gigabyte run little besides the server, so they keep
+# back less (t1.micro keeps its 512M heap)
+TINY_INSTANCE_MB = 1024
+TINY_RESERVE_MB = 96
+
+# Only part of swap is worth handing to the heap, and never more than RAM.
+# Swap strategies supply their own ratio depending on page-out cost.
+SWAP_RATIO = 0.5
+
+# Minecraft gains little from huge heaps and pays for them in pause times
+MIN_HEAP_MB = 256
+MAX_HEAP_MB = 12288
+HEAP_STEP_MB = 64
+
+# G1 only pays off with a second core and a heap worth partitioning
+G1_MIN_VCPUS = 2
+G1_MIN_HEAP_MB = 1024
+
+
+def parse_memory(value):
+    """Parse a JVM style size (512M, 2G, 1024) into megabytes"""
+    if isinstance(value, (int, long)):
+        return value
+    value = value.strip().upper()
+    try:
+        if value.endswith('G'):
+            return int(float(value[:-1]) * 1024)
+        if value.endswith('M'):
+            return int(value[:-1])
+        return int(value)
+    except ValueError:
+        raise InvalidConfig('Invalid memory size {}'.format(value))
+
+
+class JVMSizing(object):
+    """
+    Derive heap size and GC settings for the minecraft server JVM.
+
+    Everything is computed from the instance type's memory and vCPU count
+    unless overridden, which is how config.ini world sections can pin
+    ``heap_size``, ``gc``, ``gc_flags`` or ``pretouch``.
+
+    """
+
+    def __init__(self, instance_type, swap_mb=0, swap_ratio=SWAP_RATIO,
+                 heap_size=None, gc=None, gc_flags=None, pretouch=None):
+        if instance_type in INSTANCE_SPECS:
+            self.memory_mb, self.vcpus = INSTANCE_SPECS[instance_type]
+        else:
+            log.warn('Unknown instance type {}, assuming {}MB and {} vCPU'
+                     .format(instance_type, *DEFAULT_SPEC))
+            self.memory_mb, self.vcpus = DEFAULT_SPEC
+        self.instance_type = instance_type
+        self.swap_mb = swap_mb
+        self.swap_ratio = swap_ratio
+        self._heap_size = heap_size
+        self._gc = gc
+        self._gc_flags = gc_flags
+        self._pretouch = pretouch
+
+    @classmethod
+    def from_options(cls, instance_type, get_option, swap_mb=0,
+                     swap_ratio=SWAP_RATIO):
+        """Build from a command's ``_get_option``"""
+        return cls(
+            instance_type,
+            swap_mb=swap_mb,
+            swap_ratio=swap_ratio,
+            heap_size=get_option('heap_size'),
+            gc=get_option('gc'),
+            gc_flags=get_option('gc_flags'),
+            pretouch=get_option('pretouch'))
+
+    @property
+    def heap_mb(self):
+        if self._heap_size:
+            return parse_memory(self._heap_size)
+        if self.memory_mb < TINY_INSTANCE_MB:
+            reserve = TINY_RESERVE_MB
+        else:
+            reserve = min(max(self.memory_mb * RESERVE_RATIO, MIN_RESERVE_MB),
+                          MAX_RESERVE_MB)
+        usable = self.memory_mb - reserve
+        usable += min(self.swap_mb, self.memory_mb) * self.swap_ratio
+        heap = int(usable) // HEAP_STEP_MB * HEAP_STEP_MB
+        return min(max(heap, MIN_HEAP_MB), MAX_HEAP_MB)
+
+    @property
+    def gc(self):
+        if self._gc:
+            gc = self._gc.lower()
+            if gc not in GC_FLAGS:
+                raise InvalidConfig('Unknown gc {}, choose from {}'.format(
+                    gc, ', '.join(sorted(GC_FLAGS))))
+            return gc
+        if self.vcpus >= G1_MIN_VCPUS and self.heap_mb >= G1_MIN_HEAP_MB:
+            return 'g1'
+        return 'cms'
+
+    @property
+    def pretouch(self):
+        if self._pretouch is not None:
+            return asbool(self._pretouch)
+        # pre-touching a heap that spills into swap just pages it out again
+        return not self.swap_mb and self.heap_mb >= G1_MIN_HEAP_MB
+
+    def gc_options(self):
+        if self._gc_flags:
+            return self._gc_flags.split()
+        flags = list(GC_FLAGS[self.gc])
+        if self.gc == 'g1':
+            flags.append('-XX:ParallelGCThreads={}'.format(self.vcpus))
+            flags.append(
+                '-XX:ConcGCThreads={}'.format(max(1, self.vcpus // 4)))
+        return flags
+
+    def jvm_options(self):
+        heap = '{}M'.format(self.heap_mb)
+        opts = ['-Xms' + heap, '-Xmx' + heap]
+        if self.pretouch:
+            opts.append('-XX:+AlwaysPreTouch')
+        opts.extend(self.gc_options())
+        return opts
+
+    def jvm_opts(self):
+        return ' '.join(self.jvm_options())
+
+    def __repr__(self):
+        return '<JVMSizing {} heap={}M gc={}>'.format(
+            self.instance_type, self.heap_mb, self.gc)
@@ -0,0 +1,91 @@
+import logging
+
+from pynecroud.exceptions import InvalidConfig
+from pynecroud.sizing import INSTANCE_SPECS, DEFAULT_SPEC
+
+log = logging.getLogger(__name__)
+
+# instance types that come with instance-store (ephemeral) disks
+INSTANCE_STORE_TYPES = frozenset([
+    'm1.small', 'm1.medium', 'm1.large', 'm1.xlarge',
+    'm3.medium', 'm3.large', 'm3.xlarge', 'm3.2xlarge',
+    'c1.medium', 'c1.xlarge',
+    'c3.large', 'c3.xlarge', 'c3.2xlarge',
+    'm2.xlarge', 'm2.2xlarge', 'm2.4xlarge',
+])
+
+DEFAULT_SWAP_MB = 1024
+
+
+class SwapStrategy(object):
+    """
+    A way of extending memory with swap.
+
+    ``heap_ratio`` is the share of the swap size that the JVM heap may
+    count on, which reflects how cheap a page-out is for the strategy.
+
+    """
+
+    def __init__(self, name, script, heap_ratio, swappiness):
+        self.name = name
+        self.script = script
+        self.heap_ratio = heap_ratio
+        self.swappiness = swappiness
+
+    def default_size(self, instance_type):
+        return DEFAULT_SWAP_MB
+
+    def sub_params(self, size_mb, swappiness=None):
+        if swappiness is None:
+            swappiness = self.swappiness
+        return {'size_mb': size_mb, 'swappiness': swappiness}
+
+    def __repr__(self):
+        return '<SwapStrategy {}>'.format(self.name)
+
+
+class ZramSwap(SwapStrategy):
+    """Compressed swap kept in RAM, sized to half of the instance memory"""
+
+    def default_size(self, instance_type):
+        memory_mb = INSTANCE_SPECS.get(instance_type, DEFAULT_SPEC)[0]
+        return memory_mb // 2
+
+
+STRATEGIES = dict((s.name, s) for s in [
+    # swap file on the EBS root volume; every page-out is EBS I/O
+    SwapStrategy('file', 'allocate_swap.sh', 0.25, 10),
+    # swap file on the instance store
+    SwapStrategy('ephemeral', 'swap_ephemeral.sh', 0.5, 10),
+    # pages compress about 3:1, so most of the device is a net gain
+    ZramSwap('zram', 'swap_zram.sh', 0.5, 80),
+])
+
+
+def get_strategy(name, instance_type):
+    """
+    Look up a swap strategy by name, returning None for ``none``.
+
+    ``auto`` uses the instance store when the instance type has one and
+    zram otherwise. ``ephemeral`` on a type without one becomes ``file``,
+    so the heap is sized for the swap it will really get.
+
+    """
+    name = (name or 'none').lower()
+    if name == 'none':
+        return None
+    if name == 'auto':
+        if instance_type in INSTANCE_STORE_TYPES:
+            name = 'ephemeral'
+        else:
+            name = 'zram'
+        log.info('Using {} swap for {}'.format(name, instance_type))
+    elif name == 'ephemeral' and instance_type not in INSTANCE_STORE_TYPES:
+        log.warn('{} has no instance store, using file swap on the root '
+                 'volume'.format(instance_type))
+        name = 'file'
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise InvalidConfig('Unknown swap strategy {}, choose from {}'.format(
+            name, ', '.join(['auto', 'none'] + sorted(STRATEGIES))))
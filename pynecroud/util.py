@@ -1,5 +1,6 @@
 import os
 import ConfigParser
+import importlib
 import tempfile
 from contextlib import contextmanager
 
@@ -34,6 +35,12 @@ def temporary_file(text=False, **kw):
 
 def asbool(value):
     if isinstance(value, basestring):
-        return value.startswith('t')
+        return value.strip().lower().startswith('t')
     else:
         return bool(value)
+
+
+def import_object(path):
+    """Import an object from a ``package.module:name`` path"""
+    module_name, name = path.split(':')
+    return getattr(importlib.import_module(module_name), name)